@@ -86,11 +86,11 @@ std::string AgentManager::sendToAgent(const std::string& agentId, const std::str
 }
 
 void AgentManager::broadcastMessage(const std::string& message) {
-    std::lock_guard<std::mutex> lock(agentsMutex_);
-
-    for (const auto& pair : agents_) {
-        if (pair.second->isRunning()) {
-            pair.second->processMessage(message);
+    // Work from a snapshot so agents run without agentsMutex_ held and can
+    // safely call back into the manager
+    for (const auto& agent : getAllAgents()) {
+        if (agent->isRunning()) {
+            agent->processMessage(message);
         }
     }
 }
@@ -56,6 +56,14 @@ class AgentManager {
 
     /**
      * @brief Broadcast a message to all agents
+     *
+     * Running agents receive the message one at a time, in ID order, on the
+     * calling thread. The roster is snapshotted first and the manager's lock
+     * is not held while agents run, so agents may call back into the manager.
+     * As a consequence, an agent that is unregistered or stopped during a
+     * broadcast may still receive processMessage() after unregisterAgent()
+     * has returned.
+     *
      * @param message The message to broadcast
      */
     void broadcastMessage(const std::string& message);
@@ -83,7 +83,7 @@ Command Command::fromJsonString(const std::string& json_str) {
 }
 
 std::string Command::toJsonString() const {
-    return juce::JSON::toString(toJson()).toStdString();
+    return juce::JSON::toString(toJson(), true).toStdString();
 }
 
 // CommandResponse implementation
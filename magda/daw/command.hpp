@@ -69,7 +69,7 @@ class Command {
     static Command fromJsonString(const std::string& json_str);
 
     /**
-     * @brief Convert to JSON string
+     * @brief Convert to a compact, single-line JSON string
      */
     std::string toJsonString() const;
 
@@ -88,6 +88,8 @@ TEST_CASE("Command JSON Serialization", "[command]") {
         cmd.setParameter("fadeOut", 1.0);
 
         std::string json_str = cmd.toJsonString();
+        REQUIRE(json_str.find('\n') == std::string::npos);
+
         Command cmd2 = Command::fromJsonString(json_str);
 
         REQUIRE(cmd2.getType() == "stop");